@@ -1,5 +1,9 @@
+import io
+
 import streamlit as st
+import numpy as np
 import pandas as pd
+import plotly.express as px
 
 # --------------------------------------------------
 # PAGE CONFIG
@@ -65,87 +69,437 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-uploaded_file = st.file_uploader("Upload Spend Data (Excel)", type=["xlsx"])
+uploaded_file = st.file_uploader(
+    "Upload Spend Data (Excel / Parquet / Feather / CSV)",
+    type=["xlsx", "parquet", "feather", "csv"],
+    help="Tip: convert a large Excel once to Parquet or Feather — those "
+         "columnar formats load in a fraction of the time on later sessions."
+)
+
+# --------------------------------------------------
+# COLUMN NAMES & METRICS
+# --------------------------------------------------
+PART_FAMILY = "Part Family"
+VEHICLE_MODEL = "Vehicle Model"
+PART = "PartNo"
+SUPPLIER = "Vendor"
+PRICE = "PO Price"
+PLANT = "Plant"
+
+METRICS = {
+    "PO Price": "PO Price",
+    "RMRatePerKg": "RM Rate",
+    "GrossWeight": "Gross Weight",
+    "Net RM Cost": "Net RM Cost",
+    "Net Conversion Cost": "Conversion Cost",
+    "Overhead Combined Cost": "Overhead Cost",
+    "Profit Cost": "Profit Cost",
+    "Rejection Cost": "Rejection Cost",
+    "Packaging Cost": "Packaging Cost",
+    "Freight Cost": "Freight Cost"
+}
+
+# --------------------------------------------------
+# CACHED DATA LOADING & FILTERING
+# --------------------------------------------------
+@st.cache_data(show_spinner=False)
+def load_spend(file_bytes, file_name):
+    """Parse, clean and coerce the uploaded file exactly once per file."""
+    buffer = io.BytesIO(file_bytes)
+    suffix = file_name.rsplit(".", 1)[-1].lower()
+
+    if suffix == "parquet":
+        df = pd.read_parquet(buffer)
+    elif suffix == "feather":
+        df = pd.read_feather(buffer)
+    elif suffix == "csv":
+        df = pd.read_csv(buffer)
+    else:
+        df = pd.read_excel(buffer, engine="calamine")
+
+    df.columns = df.columns.str.strip()
+
+    # Coerce every metric column through one sub-block assignment instead of
+    # growing the frame column by column. downcast="float" lands them in
+    # float32 — ample precision for rupee amounts, half the scan bandwidth.
+    numeric_cols = [col for col in METRICS if col in df.columns]
+    df[numeric_cols] = df[numeric_cols].apply(
+        pd.to_numeric, errors="coerce", downcast="float"
+    )
+
+    # The filter columns are low-cardinality labels repeated across many
+    # rows; as categoricals, unique()/equality work on the small dictionary
+    # and integer codes instead of millions of Python strings.
+    for col in (PART_FAMILY, VEHICLE_MODEL, PART, SUPPLIER, PLANT):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
+    # st.dataframe serializes every frame through Arrow on render; keeping the
+    # remaining free-text columns Arrow-backed hands them over without a
+    # per-render object-to-Arrow re-encode. Matched by dtype predicate, not
+    # select_dtypes("object"): pandas 3 parses text as the new str dtype.
+    for col in df.columns:
+        dtype = df[col].dtype
+        if pd.api.types.is_object_dtype(dtype) or (
+            pd.api.types.is_string_dtype(dtype)
+            and not isinstance(dtype, pd.CategoricalDtype)
+        ):
+            df[col] = df[col].astype("string[pyarrow]")
+
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def filter_index(df, family, model, part):
+    """Positional row indices for a sidebar filter selection.
+
+    Caching the small integer array instead of sliced frame copies keeps
+    the master frame as the only materialized copy of the data; callers
+    take views off it on demand.
+    """
+    mask = (df[PART_FAMILY] == family).to_numpy()
+
+    if model != "All Models":
+        mask &= (df[VEHICLE_MODEL] == model).to_numpy()
+
+    if part != "All Parts":
+        mask &= (df[PART] == part).to_numpy()
+
+    return np.flatnonzero(mask)
+
+
+@st.cache_data(show_spinner=False)
+def filter_options(df):
+    """Prebuild the hierarchical sidebar option lists once per upload.
+
+    Returns the family list plus per-family model lists and per-(family,
+    model) part lists, so reruns never re-run unique()/sorted() on the data.
+    Category dictionaries are already unique, sorted and NaN-free, so each
+    option list is a pruned dictionary walk rather than a hash-and-sort of
+    the rows.
+    """
+    def options(series):
+        return series.cat.remove_unused_categories().cat.categories.tolist()
+
+    families = df[PART_FAMILY].cat.categories.tolist()
+
+    models = {
+        family: options(group[VEHICLE_MODEL])
+        for family, group in df.groupby(PART_FAMILY, observed=True)
+    }
+
+    parts = {
+        family: options(group[PART])
+        for family, group in df.groupby(PART_FAMILY, observed=True)
+    }
+    parts.update({
+        (family, model): options(group[PART])
+        for (family, model), group in df.groupby(
+            [PART_FAMILY, VEHICLE_MODEL], observed=True
+        )
+    })
+
+    return families, models, parts
+
+
+@st.cache_data(show_spinner=False)
+def portfolio_kpis(df):
+    """Whole-file nunique counts for the KPI cards, computed once per upload."""
+    return {
+        col: int(df[col].nunique())
+        for col in (PART, SUPPLIER, VEHICLE_MODEL, PART_FAMILY, PLANT)
+    }
+
+
+@st.cache_data(show_spinner=False)
+def metric_summary(df):
+    """Min/max per metric plus the owning part numbers, in one ndarray pass.
+
+    The reductions run on a single contiguous float block via the nan-aware
+    NumPy kernels, so each column is scanned exactly once in native code.
+    """
+    present = [col for col in METRICS if col in df.columns]
+    block = df[present].to_numpy(dtype=float)
+
+    # Zeros in the price/rate columns are placeholders, not prices.
+    for i, col in enumerate(present):
+        if col in ("PO Price", "RMRatePerKg"):
+            block[block[:, i] == 0, i] = np.nan
+
+    parts = df[PART].to_numpy()
+    rows = []
+
+    for i, col in enumerate(present):
+        values = block[:, i]
+
+        if np.isnan(values).all():
+            continue
+
+        imin = np.nanargmin(values)
+        imax = np.nanargmax(values)
+
+        rows.append({
+            "Metric": METRICS[col],
+            "Min": values[imin],
+            "(Min) Part No": parts[imin],
+            "Max": values[imax],
+            "(Max) Part No": parts[imax],
+        })
+
+    # Round in float64: float32 storage noise (48.209999...) must not reach
+    # the table or the chart hover.
+    return pd.DataFrame(rows).round({"Min": 2, "Max": 2})
+
+
+@st.cache_data(show_spinner=False)
+def vendor_ranking(df):
+    """Average PO price and coverage per vendor, one grouped pass in C.
+
+    observed=True groups over the vendor codes actually present, so the
+    pass stays proportional to the filtered slice, not the full dictionary.
+    """
+    priced = df[df[PRICE] > 0]
+
+    if priced.empty:
+        return pd.DataFrame(columns=[SUPPLIER, "Avg PO Price", "Parts", "Lines"])
+
+    return (
+        priced.groupby(SUPPLIER, observed=True)
+        .agg(**{
+            "Avg PO Price": (PRICE, "mean"),
+            "Parts": (PART, "nunique"),
+            "Lines": (PRICE, "size"),
+        })
+        .reset_index()
+        .sort_values("Avg PO Price")
+    )
+
+
+@st.cache_data(show_spinner=False)
+def lowest_cost_per_part(df):
+    """Cheapest sourcing row for every part, via one grouped idxmin pass."""
+    priced = df[df[PRICE] > 0]
+
+    if priced.empty:
+        return df.iloc[0:0]
+
+    idx = priced.groupby(PART, observed=True)[PRICE].idxmin()
+    return df.loc[idx.to_numpy()].sort_values(PART)
+
+
+VENDOR_CHART_LIMIT = 30
+CHART_METRIC_LIMIT = 8
+
+
+@st.cache_resource(show_spinner=False)
+def vendor_figure(ranking):
+    """Bar chart of the cheapest vendors, capped so render cost stays flat.
+
+    A single fill colour and a bounded trace count keep the figure cheap to
+    lay out and ship no matter how many vendors the selection contains.
+    """
+    top = ranking.nsmallest(VENDOR_CHART_LIMIT, "Avg PO Price")
+
+    fig = px.bar(top, x=SUPPLIER, y="Avg PO Price")
+    fig.update_traces(marker_color="#4e73df")
+    fig.update_layout(
+        margin=dict(t=20, b=20),
+        plot_bgcolor="white",
+        xaxis_title=None
+    )
+
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def summary_figure(summary_df):
+    """Min-vs-Max bar chart for the metric summary, built once per summary."""
+    chart_df = summary_df.melt(
+        id_vars="Metric", value_vars=["Min", "Max"],
+        var_name="Bound", value_name="Value"
+    )
+
+    fig = px.bar(
+        chart_df, x="Metric", y="Value", color="Bound",
+        barmode="group",
+        color_discrete_map={"Min": "#4e73df", "Max": "#6f42c1"}
+    )
+    fig.update_layout(
+        margin=dict(t=20, b=20),
+        plot_bgcolor="white",
+        legend_title_text=""
+    )
+
+    return fig
+
+
+PAGE_SIZE = 500
+
+
+def metric_column_config(df):
+    """Two-decimal display for the cost columns.
+
+    The float32 columns carry representation noise (48.209999...) that
+    Arrow's upcast to JS doubles would otherwise render verbatim; the
+    stored values keep their full width.
+    """
+    money_cols = set(METRICS) | {"Avg PO Price", "Min", "Max"}
+    return {
+        col: st.column_config.NumberColumn(format="%.2f")
+        for col in df.columns
+        if col in money_cols
+    }
+
+
+def paginated_dataframe(df, key):
+    """Render a frame one page at a time.
+
+    Shipping a six-figure row count to the browser stalls the Arrow
+    serialize/transfer/render path; paging keeps each render bounded.
+    """
+    total = len(df)
+    pages = max(1, -(-total // PAGE_SIZE))
+
+    if pages > 1:
+        page = st.number_input(
+            f"Page (1-{pages})",
+            min_value=1, max_value=pages, value=1, key=key
+        )
+        start = (page - 1) * PAGE_SIZE
+        st.caption(f"Rows {start + 1:,}-{min(start + PAGE_SIZE, total):,} of {total:,}")
+        df = df.iloc[start:start + PAGE_SIZE]
+
+    st.dataframe(df, use_container_width=True, column_config=metric_column_config(df))
+
 
 # --------------------------------------------------
 # SEARCH FUNCTION
 # --------------------------------------------------
+@st.cache_data(show_spinner=False)
+def stringified_numeric(df):
+    """Stringified copies of the numeric columns, built once per slice.
+
+    Every search box on a page scans the same filtered frame, and the only
+    expensive part of the scan is converting numeric columns to strings;
+    caching those conversions makes repeat searches pure C scans.
+    """
+    return {
+        col: df[col].astype(str)
+        for col in df.columns
+        if not (
+            isinstance(df[col].dtype, pd.CategoricalDtype)
+            or pd.api.types.is_string_dtype(df[col])
+        )
+    }
+
+
+def _term_mask(df, numeric_strings, term):
+    """Rows where a single term appears in any column.
+
+    One vectorized contains() per column (few) instead of one per row
+    (many); regex=False keeps it on the plain substring fast path.
+    """
+    mask = np.zeros(len(df), dtype=bool)
+
+    for col in df.columns:
+        series = df[col]
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Match against the small category dictionary, then broadcast
+            # the verdicts to rows through the integer codes.
+            # Index.str.contains already yields a bool ndarray here.
+            hits = series.cat.categories.astype(str).str.contains(
+                term, case=False, regex=False
+            )
+            # An all-NaN column has an empty dictionary — nothing to match.
+            # NaN codes of -1 are clipped before indexing (they would wrap
+            # to the last category) and then masked out by codes >= 0.
+            if hits.size:
+                codes = series.cat.codes.to_numpy()
+                mask |= (codes >= 0) & hits[codes.clip(0)]
+            continue
+
+        if col in numeric_strings:
+            series = numeric_strings[col]
+
+        mask |= series.str.contains(
+            term, case=False, na=False, regex=False
+        ).to_numpy(dtype=bool, na_value=False)
+
+    return mask
+
+
 def full_text_search(df, query):
-    if not query:
+    """Keep rows where every whitespace-separated term matches some column."""
+    terms = query.split() if query else []
+
+    if not terms:
         return df
-    return df[
-        df.astype(str)
-        .apply(lambda row: row.str.contains(query, case=False, na=False))
-        .any(axis=1)
-    ]
+
+    numeric_strings = stringified_numeric(df)
+
+    row_mask = np.ones(len(df), dtype=bool)
+    for term in terms:
+        row_mask &= _term_mask(df, numeric_strings, term)
+
+    return df[row_mask]
 
 # --------------------------------------------------
 # MAIN LOGIC
 # --------------------------------------------------
 if uploaded_file:
 
-    df = pd.read_excel(uploaded_file)
-    df.columns = df.columns.str.strip()
-
-    PART_FAMILY = "Part Family"
-    VEHICLE_MODEL = "Vehicle Model"
-    PART = "PartNo"
-    SUPPLIER = "Vendor"
-    PRICE = "PO Price"
-    PLANT = "Plant"
-
-    # Metrics Definition
-    METRICS = {
-        "PO Price": "PO Price",
-        "RMRatePerKg": "RM Rate",
-        "GrossWeight": "Gross Weight",
-        "Net RM Cost": "Net RM Cost",
-        "Net Conversion Cost": "Conversion Cost",
-        "Overhead Combined Cost": "Overhead Cost",
-        "Profit Cost": "Profit Cost",
-        "Rejection Cost": "Rejection Cost",
-        "Packaging Cost": "Packaging Cost",
-        "Freight Cost": "Freight Cost"
-    }
-
-    for col in METRICS.keys():
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+    df = load_spend(uploaded_file.getvalue(), uploaded_file.name)
 
     # ---------------- FILTERS ----------------
     st.sidebar.markdown("## 🎯 Filters")
 
-    family = st.sidebar.selectbox(
-        "Part Family",
-        sorted(df[PART_FAMILY].dropna().unique())
-    )
+    families, model_options, part_options = filter_options(df)
 
-    df_filtered = df[df[PART_FAMILY] == family]
+    family = st.sidebar.selectbox("Part Family", families)
 
     model = st.sidebar.selectbox(
         "Vehicle Model",
-        ["All Models"] + sorted(df_filtered[VEHICLE_MODEL].dropna().unique())
+        ["All Models"] + model_options.get(family, [])
     )
 
-    if model != "All Models":
-        df_filtered = df_filtered[df_filtered[VEHICLE_MODEL] == model]
+    part_key = family if model == "All Models" else (family, model)
 
     part = st.sidebar.selectbox(
         "Part No",
-        ["All Parts"] + sorted(df_filtered[PART].dropna().unique())
+        ["All Parts"] + part_options.get(part_key, [])
     )
 
-    if part != "All Parts":
-        df_filtered = df_filtered[df_filtered[PART] == part]
+    df_filtered = df.take(filter_index(df, family, model, part))
 
     if df_filtered.empty:
         st.warning("No data available.")
         st.stop()
 
     # ---- Core Price Calculations ----
-    price_series = df_filtered[PRICE][df_filtered[PRICE] != 0]
-    min_price = price_series.min() if not price_series.empty else None
-    max_price = price_series.max() if not price_series.empty else None
+    # One ndarray view of the price column feeds every reduction below; no
+    # intermediate Series copies are built along the way.
+    prices = df_filtered[PRICE].to_numpy()
+    valid = np.flatnonzero((prices != 0) & ~np.isnan(prices))
+
+    if valid.size == 0:
+        min_price = max_price = None
+        min_price_idx = max_price_idx = None
+        is_min_price = np.zeros(len(df_filtered), dtype=bool)
+    else:
+        window = prices[valid]
+        min_pos = valid[window.argmin()]
+        max_pos = valid[window.argmax()]
+        min_price = prices[min_pos]
+        max_price = prices[max_pos]
+        min_price_idx = df_filtered.index[min_pos]
+        max_price_idx = df_filtered.index[max_pos]
+        # Computed once here so every tab that needs the benchmark rows
+        # reuses the same mask instead of rescanning the price column.
+        # min_price comes from this very array via argmin, so exact
+        # equality is tie-safe; a tolerance would pull in near-misses.
+        is_min_price = prices == min_price
+
     spread = (max_price - min_price) if min_price and max_price else 0
     spread_pct = (spread / max_price * 100) if max_price else 0
 
@@ -161,35 +515,40 @@ if uploaded_file:
     # =====================================================
     # TAB 1 – OVERVIEW (UPDATED KPI CARDS)
     # =====================================================
-    with tab1:
+    # Each tab body is a fragment: widget interactions inside a tab (search
+    # submits, page changes) rerun only that fragment, not the whole script.
+    @st.fragment
+    def overview_tab():
 
         st.markdown('<div class="section-box">', unsafe_allow_html=True)
         st.markdown('<div class="section-title">Portfolio Overview</div>', unsafe_allow_html=True)
 
+        kpis = portfolio_kpis(df)
+
         c1, c2, c3, c4, c5 = st.columns(5)
 
         c1.markdown(
-            f"<div class='metric-card card-blue'><h3>{df[PART].nunique()}</h3>Unique Parts</div>",
+            f"<div class='metric-card card-blue'><h3>{kpis[PART]}</h3>Unique Parts</div>",
             unsafe_allow_html=True
         )
 
         c2.markdown(
-            f"<div class='metric-card card-green'><h3>{df[SUPPLIER].nunique()}</h3>Active Vendors</div>",
+            f"<div class='metric-card card-green'><h3>{kpis[SUPPLIER]}</h3>Active Vendors</div>",
             unsafe_allow_html=True
         )
 
         c3.markdown(
-            f"<div class='metric-card card-purple'><h3>{df[VEHICLE_MODEL].nunique()}</h3>Vehicle Models</div>",
+            f"<div class='metric-card card-purple'><h3>{kpis[VEHICLE_MODEL]}</h3>Vehicle Models</div>",
             unsafe_allow_html=True
         )
 
         c4.markdown(
-            f"<div class='metric-card card-amber'><h3>{df[PART_FAMILY].nunique()}</h3>Part Families</div>",
+            f"<div class='metric-card card-amber'><h3>{kpis[PART_FAMILY]}</h3>Part Families</div>",
             unsafe_allow_html=True
         )
 
         c5.markdown(
-            f"<div class='metric-card card-teal'><h3>{df[PLANT].nunique()}</h3>Plants</div>",
+            f"<div class='metric-card card-teal'><h3>{kpis[PLANT]}</h3>Plants</div>",
             unsafe_allow_html=True
         )
 
@@ -199,53 +558,72 @@ if uploaded_file:
         st.markdown('<div class="section-box">', unsafe_allow_html=True)
         st.markdown('<div class="section-title">Filtered Data View</div>', unsafe_allow_html=True)
 
-        search_query = st.text_input("Search within filtered dataset", key="overview_search")
-        st.dataframe(full_text_search(df_filtered, search_query), use_container_width=True)
+        # A form batches the input: the script reruns once per submitted
+        # query instead of on every edit of the text box.
+        with st.form("overview_search_form", border=False):
+            search_query = st.text_input("Search within filtered dataset", key="overview_search")
+            st.form_submit_button("Search")
+
+        paginated_dataframe(full_text_search(df_filtered, search_query), key="overview_page")
 
         st.markdown('</div>', unsafe_allow_html=True)
 
     # =====================================================
     # TAB 2 – COST INSIGHTS (UNCHANGED)
     # =====================================================
-    with tab2:
+    @st.fragment
+    def cost_tab():
 
         st.markdown('<div class="section-box">', unsafe_allow_html=True)
         st.markdown('<div class="section-title">Metric Summary</div>', unsafe_allow_html=True)
 
-        summary_data = []
-
-        for col, label in METRICS.items():
+        summary_df = metric_summary(df_filtered)
+        st.dataframe(
+            summary_df,
+            use_container_width=True,
+            column_config=metric_column_config(summary_df)
+        )
 
-            if col not in df_filtered.columns:
-                continue
+        st.markdown('</div>', unsafe_allow_html=True)
 
-            series = df_filtered[col]
+        if not summary_df.empty:
+            st.markdown('<div class="section-box">', unsafe_allow_html=True)
+            st.markdown('<div class="section-title">Min vs Max by Metric</div>', unsafe_allow_html=True)
 
-            if col in ["PO Price", "RMRatePerKg"]:
-                series = series[series != 0]
+            show_all = st.checkbox("Show all metrics", key="chart_all_metrics")
 
-            if series.dropna().empty:
-                continue
+            chart_df = summary_df
+            if not show_all:
+                # Only metrics with an actual spread carry information;
+                # capping at the widest few keeps the payload small.
+                spreads = summary_df["Max"] - summary_df["Min"]
+                chart_df = summary_df.loc[
+                    spreads[spreads > 0].nlargest(CHART_METRIC_LIMIT).index
+                ]
 
-            min_val = series.min()
-            max_val = series.max()
+            if chart_df.empty:
+                st.caption("No metric spread in the current selection.")
+            else:
+                # cache_resource keyed on the chart table: the figure is only
+                # rebuilt when that table changes, not on every rerun.
+                st.plotly_chart(summary_figure(chart_df), use_container_width=True)
 
-            min_rows = df_filtered[df_filtered[col] == min_val]
-            max_rows = df_filtered[df_filtered[col] == max_val]
+            st.markdown('</div>', unsafe_allow_html=True)
 
-            min_row = min_rows.iloc[0] if not min_rows.empty else None
-            max_row = max_rows.iloc[0] if not max_rows.empty else None
+        # Vendor Ranking
+        st.markdown('<div class="section-box">', unsafe_allow_html=True)
+        st.markdown('<div class="section-title">Vendor Ranking</div>', unsafe_allow_html=True)
 
-            summary_data.append({
-                "Metric": label,
-                "Min": min_val,
-                "(Min) Part No": min_row[PART] if min_row is not None else None,
-                "Max": max_val,
-                "(Max) Part No": max_row[PART] if max_row is not None else None,
-            })
+        ranking = vendor_ranking(df_filtered)
+        paginated_dataframe(ranking, key="vendor_page")
 
-        summary_df = pd.DataFrame(summary_data)
-        st.dataframe(summary_df, use_container_width=True)
+        if not ranking.empty:
+            if len(ranking) > VENDOR_CHART_LIMIT:
+                st.caption(
+                    f"Chart shows the {VENDOR_CHART_LIMIT} lowest-priced "
+                    f"vendors of {len(ranking)}."
+                )
+            st.plotly_chart(vendor_figure(ranking), use_container_width=True)
 
         st.markdown('</div>', unsafe_allow_html=True)
 
@@ -253,25 +631,35 @@ if uploaded_file:
         st.markdown('<div class="section-box">', unsafe_allow_html=True)
         st.markdown('<div class="section-title">Filtered Data View</div>', unsafe_allow_html=True)
 
-        search_query2 = st.text_input("Search within cost insights", key="cost_search")
-        st.dataframe(full_text_search(df_filtered, search_query2), use_container_width=True)
+        with st.form("cost_search_form", border=False):
+            search_query2 = st.text_input("Search within cost insights", key="cost_search")
+            st.form_submit_button("Search")
+
+        paginated_dataframe(full_text_search(df_filtered, search_query2), key="cost_page")
 
         st.markdown('</div>', unsafe_allow_html=True)
 
     # =====================================================
     # TAB 3 – IDEAL SOURCING (UNCHANGED)
     # =====================================================
-    with tab3:
+    @st.fragment
+    def sourcing_tab():
 
         st.markdown('<div class="section-box">', unsafe_allow_html=True)
         st.markdown('<div class="section-title">Unique Lowest Cost Combinations</div>', unsafe_allow_html=True)
 
         lowest_unique = (
-            df_filtered[df_filtered[PRICE] == min_price]
+            df_filtered[is_min_price]
             .drop_duplicates(subset=[PART, SUPPLIER])
         )
 
-        st.dataframe(lowest_unique, use_container_width=True)
+        paginated_dataframe(lowest_unique, key="sourcing_page")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        st.markdown('<div class="section-box">', unsafe_allow_html=True)
+        st.markdown('<div class="section-title">Lowest Cost per Part</div>', unsafe_allow_html=True)
+
+        paginated_dataframe(lowest_cost_per_part(df_filtered), key="per_part_page")
         st.markdown('</div>', unsafe_allow_html=True)
 
         st.markdown('<div class="section-box">', unsafe_allow_html=True)
@@ -279,8 +667,8 @@ if uploaded_file:
 
         if spread > 0 and min_price and max_price:
 
-            min_row = df_filtered[df_filtered[PRICE] == min_price].iloc[0]
-            max_row = df_filtered[df_filtered[PRICE] == max_price].iloc[0]
+            min_row = df_filtered.loc[min_price_idx]
+            max_row = df_filtered.loc[max_price_idx]
 
             st.write(f"""
             The highest PO price Part **{max_row[PART]}** can be benchmarked 
@@ -302,5 +690,14 @@ if uploaded_file:
 
         st.markdown('</div>', unsafe_allow_html=True)
 
+    with tab1:
+        overview_tab()
+
+    with tab2:
+        cost_tab()
+
+    with tab3:
+        sourcing_tab()
+
 else:
     st.info("Please upload spend data to begin analysis.")